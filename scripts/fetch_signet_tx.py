@@ -8,20 +8,36 @@ and outputs the data in a format that Cato can verify.
 
 Usage:
     python fetch_signet_tx.py <txid> [--input <n>]
+    python fetch_signet_tx.py <txid> --all-inputs  # Every input, fetched in parallel
     python fetch_signet_tx.py --demo  # Use a demo transaction
 
 The output can be used to verify Bitcoin state transitions on Starknet.
 """
 
 import argparse
+import binascii
+import functools
 import hashlib
+import http.client
 import json
 import struct
 import sys
-from dataclasses import dataclass
-from typing import List, Optional, Tuple
-import urllib.request
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from itertools import chain
+from types import ModuleType
+from typing import List, Optional, Tuple, Union
 import urllib.error
+import urllib.parse
+import urllib.request
+
+orjson: Optional[ModuleType]
+try:
+    import orjson as _orjson
+    orjson = _orjson
+except ImportError:  # optional; falls back to stdlib json, which also accepts bytes
+    orjson = None
 
 # Bitcoin Signet block explorer API
 SIGNET_API = "https://mempool.space/signet/api"
@@ -29,23 +45,65 @@ SIGNET_API = "https://mempool.space/signet/api"
 # Bitcoin Inquisition (Signet with OP_CAT) - alternative
 INQUISITION_API = "https://mempool.space/signet/api"  # Same API, different node
 
+_sha256 = hashlib.sha256
+
+
+# CompactSize (var_int) encoders. Lengths below 0xfd are a single byte and
+# come straight from a table; wider values pick a prefixed packer by
+# bit_length (<=16 bits: 0xfd+u16, <=32: 0xfe+u32, <=64: 0xff+u64).
+_VARINT_SMALL = tuple(bytes([i]) for i in range(0xfd))
+_VARINT_WIDE = (
+    (functools.partial(struct.Struct('<BH').pack, 0xfd),) * 17
+    + (functools.partial(struct.Struct('<BI').pack, 0xfe),) * 16
+    + (functools.partial(struct.Struct('<BQ').pack, 0xff),) * 32
+)
+
+
+# Precompiled packers for the fixed-layout parts of the sighash path, so the
+# format string is parsed once at import instead of on every call.
+_pack_u64_into = struct.Struct('<Q').pack_into
+# nVersion, hashPrevouts, hashSequence, outpoint (txid, vout)
+_PREIMAGE_HEAD = struct.Struct('<I32s32s32sI')
+# value, nSequence, hashOutputs, nLocktime, sighash type
+_PREIMAGE_TAIL = struct.Struct('<QI32sII')
+
+
+def sha256d(data: Union[bytes, bytearray]) -> bytes:
+    """
+    Bitcoin double-SHA256: SHA256(SHA256(data)).
+
+    hashlib is backed by OpenSSL, which already dispatches to SHA-NI /
+    ARMv8 SHA2 instructions at runtime when the CPU supports them.
+
+    The outer pass always hashes a 32-byte digest, i.e. a single block
+    whose padding and second half of the message schedule are constant.
+    hashlib exposes no way to exploit that; a native backend replacing
+    this function could use a precomputed-schedule transform for it.
+    """
+    return _sha256(_sha256(data).digest()).digest()
 
-@dataclass
+
+@dataclass(slots=True)
 class TxInput:
-    txid: bytes  # 32 bytes, internal byte order
+    txid_le: bytes  # 32 bytes, internal (little-endian) byte order
     vout: int
     script_sig: bytes
     sequence: int
     witness: List[bytes]
 
+    @property
+    def txid(self) -> bytes:
+        """Previous txid in display (big-endian) byte order, as the API reports it."""
+        return self.txid_le[::-1]
+
 
-@dataclass
+@dataclass(slots=True)
 class TxOutput:
     value: int  # satoshis
     script_pubkey: bytes
 
 
-@dataclass
+@dataclass(slots=True)
 class Transaction:
     version: int
     inputs: List[TxInput]
@@ -53,6 +111,65 @@ class Transaction:
     locktime: int
     txid: str
 
+    # BIP143 hashPrevouts/hashSequence/hashOutputs depend only on the
+    # transaction, not on the input being signed, so they are computed once
+    # and reused for every input (cf. Bitcoin Core's PrecomputedTransactionData).
+    # The cache assumes inputs/outputs are not mutated after construction.
+    _input_hashes_cache: Optional[Tuple[bytes, bytes]] = field(
+        default=None, init=False, repr=False, compare=False)
+    _hash_outputs_cache: Optional[bytes] = field(
+        default=None, init=False, repr=False, compare=False)
+
+    @property
+    def _input_hashes(self) -> Tuple[bytes, bytes]:
+        """(hashPrevouts, hashSequence), computed and cached together."""
+        if self._input_hashes_cache is None:
+            self._input_hashes_cache = self._compute_input_hashes()
+        return self._input_hashes_cache
+
+    def _compute_input_hashes(self) -> Tuple[bytes, bytes]:
+        n_inputs = len(self.inputs)
+
+        # One repeat-count format packs every outpoint inside struct instead
+        # of looping per input in Python.
+        prevouts = struct.pack('<' + '32sI' * n_inputs, *chain.from_iterable(
+            (inp.txid_le, inp.vout) for inp in self.inputs
+        ))
+        sequences = struct.pack(f'<{n_inputs}I', *[inp.sequence for inp in self.inputs])
+
+        return sha256d(prevouts), sha256d(sequences)
+
+    @property
+    def hash_prevouts(self) -> bytes:
+        """SHA256(SHA256(all input outpoints))."""
+        return self._input_hashes[0]
+
+    @property
+    def hash_sequence(self) -> bytes:
+        """SHA256(SHA256(all input sequences))."""
+        return self._input_hashes[1]
+
+    @property
+    def hash_outputs(self) -> bytes:
+        """SHA256(SHA256(all outputs))."""
+        if self._hash_outputs_cache is None:
+            self._hash_outputs_cache = self._compute_hash_outputs()
+        return self._hash_outputs_cache
+
+    def _compute_hash_outputs(self) -> bytes:
+        output_parts = [(out, self._var_int(len(out.script_pubkey))) for out in self.outputs]
+        outputs = bytearray(sum(8 + len(vi) + len(out.script_pubkey)
+                                for out, vi in output_parts))
+        offset = 0
+        for out, vi in output_parts:
+            _pack_u64_into(outputs, offset, out.value)
+            offset += 8
+            outputs[offset:offset + len(vi)] = vi
+            offset += len(vi)
+            outputs[offset:offset + len(out.script_pubkey)] = out.script_pubkey
+            offset += len(out.script_pubkey)
+        return sha256d(outputs)
+
     def serialize_for_sighash(self, input_index: int, script_code: bytes,
                                value: int, sighash_type: int = 1) -> bytes:
         """
@@ -60,83 +177,162 @@ class Transaction:
 
         This is the preimage that gets double-SHA256'd for the sighash.
         """
-        # BIP143 sighash preimage components
-        preimage = b''
-
-        # 1. nVersion (4 bytes, little-endian)
-        preimage += struct.pack('<I', self.version)
-
-        # 2. hashPrevouts (32 bytes) - SHA256(SHA256(all input outpoints))
-        prevouts = b''
-        for inp in self.inputs:
-            prevouts += inp.txid[::-1]  # txid in internal byte order
-            prevouts += struct.pack('<I', inp.vout)
-        hash_prevouts = hashlib.sha256(hashlib.sha256(prevouts).digest()).digest()
-        preimage += hash_prevouts
-
-        # 3. hashSequence (32 bytes) - SHA256(SHA256(all input sequences))
-        sequences = b''
-        for inp in self.inputs:
-            sequences += struct.pack('<I', inp.sequence)
-        hash_sequence = hashlib.sha256(hashlib.sha256(sequences).digest()).digest()
-        preimage += hash_sequence
-
-        # 4. outpoint (36 bytes) - txid + vout for this input
         inp = self.inputs[input_index]
-        preimage += inp.txid[::-1]
-        preimage += struct.pack('<I', inp.vout)
-
-        # 5. scriptCode (var_int length + script)
-        preimage += self._var_int(len(script_code))
-        preimage += script_code
-
-        # 6. value (8 bytes, little-endian) - amount being spent
-        preimage += struct.pack('<Q', value)
-
-        # 7. nSequence (4 bytes) - sequence of this input
-        preimage += struct.pack('<I', inp.sequence)
-
-        # 8. hashOutputs (32 bytes) - SHA256(SHA256(all outputs))
-        outputs = b''
-        for out in self.outputs:
-            outputs += struct.pack('<Q', out.value)
-            outputs += self._var_int(len(out.script_pubkey))
-            outputs += out.script_pubkey
-        hash_outputs = hashlib.sha256(hashlib.sha256(outputs).digest()).digest()
-        preimage += hash_outputs
-
-        # 9. nLocktime (4 bytes)
-        preimage += struct.pack('<I', self.locktime)
-
-        # 10. sighash type (4 bytes)
-        preimage += struct.pack('<I', sighash_type)
-
-        return preimage
+        return bip143_preimage(self.version, self.hash_prevouts, self.hash_sequence,
+                               inp.txid_le, inp.vout, script_code, value, inp.sequence,
+                               self.hash_outputs, self.locktime, sighash_type)
 
     def compute_sighash(self, input_index: int, script_code: bytes,
                         value: int, sighash_type: int = 1) -> bytes:
         """Compute the BIP143 sighash for a SegWit input."""
         preimage = self.serialize_for_sighash(input_index, script_code, value, sighash_type)
-        return hashlib.sha256(hashlib.sha256(preimage).digest()).digest()
+        return sha256d(preimage)
 
     @staticmethod
     def _var_int(n: int) -> bytes:
         if n < 0xfd:
-            return bytes([n])
-        elif n <= 0xffff:
-            return b'\xfd' + struct.pack('<H', n)
-        elif n <= 0xffffffff:
-            return b'\xfe' + struct.pack('<I', n)
-        else:
-            return b'\xff' + struct.pack('<Q', n)
+            return _VARINT_SMALL[n]
+        return _VARINT_WIDE[n.bit_length()](n)
+
+
+def bip143_preimage(version: int, hash_prevouts: bytes, hash_sequence: bytes,
+                    outpoint_txid: bytes, outpoint_vout: int, script_code: bytes,
+                    value: int, sequence: int, hash_outputs: bytes,
+                    locktime: int, sighash_type: int) -> bytes:
+    """
+    Assemble a BIP143 sighash preimage from its already-hashed components.
+
+    Takes only flat values (no Transaction), so batch callers can reuse the
+    per-transaction digests. outpoint_txid is in internal byte order.
+    """
+    # The size is known up front, so fill one preallocated bytearray rather
+    # than growing bytes with +=.
+    script_len = Transaction._var_int(len(script_code))
+    preimage = bytearray(_PREIMAGE_HEAD.size + len(script_len) + len(script_code)
+                         + _PREIMAGE_TAIL.size)
+
+    # 1. nVersion (4 bytes, little-endian)
+    # 2. hashPrevouts (32 bytes)
+    # 3. hashSequence (32 bytes)
+    # 4. outpoint (36 bytes) - txid + vout for this input
+    _PREIMAGE_HEAD.pack_into(preimage, 0, version,
+                             hash_prevouts, hash_sequence, outpoint_txid, outpoint_vout)
+    offset = _PREIMAGE_HEAD.size
+
+    # 5. scriptCode (var_int length + script)
+    preimage[offset:offset + len(script_len)] = script_len
+    offset += len(script_len)
+    preimage[offset:offset + len(script_code)] = script_code
+    offset += len(script_code)
+
+    # 6. value (8 bytes, little-endian) - amount being spent
+    # 7. nSequence (4 bytes) - sequence of this input
+    # 8. hashOutputs (32 bytes)
+    # 9. nLocktime (4 bytes)
+    # 10. sighash type (4 bytes)
+    _PREIMAGE_TAIL.pack_into(preimage, offset, value, sequence,
+                             hash_outputs, locktime, sighash_type)
+
+    return bytes(preimage)
+
+
+# Keep-alive connections, one per (scheme, host) per thread: http.client
+# connections are not thread-safe and fetch_prev_outputs_batched uses a pool.
+_connections = threading.local()
+
+
+_REDIRECT_CODES = frozenset((301, 302, 303, 307, 308))
+_MAX_REDIRECTS = 10  # same limit as urllib.request's HTTPRedirectHandler
+
+
+def _http_get(url: str, timeout: float = 10, redirects: int = _MAX_REDIRECTS) -> bytes:
+    """
+    GET a URL over a reused keep-alive connection and return the body.
+
+    Avoids a fresh TCP+TLS handshake per API call. Redirects are followed
+    and non-2xx responses raise urllib.error.HTTPError, matching
+    urllib.request.urlopen. When an HTTP(S)_PROXY applies to the URL the
+    request goes through urlopen instead, so proxy settings are honoured.
+    """
+    parts = urllib.parse.urlsplit(url)
+    proxy = urllib.request.getproxies().get(parts.scheme)
+    if proxy and not urllib.request.proxy_bypass(parts.hostname or ''):
+        with urllib.request.urlopen(url, timeout=timeout) as response:
+            return response.read()
+
+    path = parts.path + (f"?{parts.query}" if parts.query else "")
+    by_host = getattr(_connections, 'by_host', None)
+    if by_host is None:
+        by_host = _connections.by_host = {}
+
+    key = (parts.scheme, parts.netloc)
+    conn = by_host.get(key)
+    if conn is None:
+        conn_cls = (http.client.HTTPSConnection if parts.scheme == 'https'
+                    else http.client.HTTPConnection)
+        conn = by_host[key] = conn_cls(parts.netloc, timeout=timeout)
+    else:
+        # A reused connection keeps the timeout it was opened with unless
+        # the live socket is updated as well.
+        conn.timeout = timeout
+        if conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+    try:
+        try:
+            conn.request('GET', path)
+            response = conn.getresponse()
+        except ConnectionError:
+            # The server closed an idle keep-alive connection; reconnect once
+            conn.close()
+            conn.request('GET', path)
+            response = conn.getresponse()
+        body = response.read()
+    except Exception:
+        # A half-finished exchange (e.g. a timeout) leaves the connection
+        # unusable, so drop it and let the next call open a fresh one.
+        conn.close()
+        by_host.pop(key, None)
+        raise
+
+    location = response.headers.get('Location')
+    if response.status in _REDIRECT_CODES and location and redirects > 0:
+        return _http_get(urllib.parse.urljoin(url, location), timeout, redirects - 1)
+    if not 200 <= response.status < 300:
+        raise urllib.error.HTTPError(url, response.status, response.reason,
+                                     response.headers, None)
+    return body
+
+
+@functools.lru_cache(maxsize=4096)
+def _fetch_tx_body(txid: str, api_base: str) -> bytes:
+    """
+    Fetch a transaction's raw JSON body, memoized by (txid, api_base).
+
+    Inputs frequently spend several outputs of the same prior transaction,
+    so the bounded LRU turns repeat lookups into cache hits. Failed fetches
+    raise and are therefore never cached.
+    """
+    return _http_get(f"{api_base}/tx/{txid}")
+
+
+def _fetch_tx_json(txid: str, api_base: str) -> dict:
+    """
+    Parse the (cached) transaction body into a fresh dict per call.
+
+    The cache holds immutable bytes rather than the parsed dict, so callers
+    may mutate what they get back without corrupting later hits.
+    """
+    body = _fetch_tx_body(txid, api_base)
+    if orjson is not None:
+        return orjson.loads(body)
+    return json.loads(body)
 
 
 def fetch_transaction(txid: str, api_base: str = SIGNET_API) -> Optional[dict]:
     """Fetch transaction data from mempool.space API."""
-    url = f"{api_base}/tx/{txid}"
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            return json.loads(response.read().decode())
+        return _fetch_tx_json(txid, api_base)
     except urllib.error.HTTPError as e:
         print(f"Error fetching transaction: {e}", file=sys.stderr)
         return None
@@ -147,10 +343,8 @@ def fetch_transaction(txid: str, api_base: str = SIGNET_API) -> Optional[dict]:
 
 def fetch_transaction_hex(txid: str, api_base: str = SIGNET_API) -> Optional[str]:
     """Fetch raw transaction hex."""
-    url = f"{api_base}/tx/{txid}/hex"
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            return response.read().decode().strip()
+        return _http_get(f"{api_base}/tx/{txid}/hex").decode().strip()
     except Exception as e:
         print(f"Error fetching tx hex: {e}", file=sys.stderr)
         return None
@@ -158,29 +352,63 @@ def fetch_transaction_hex(txid: str, api_base: str = SIGNET_API) -> Optional[str
 
 def fetch_prev_output(txid: str, vout: int, api_base: str = SIGNET_API) -> Optional[dict]:
     """Fetch the previous output being spent."""
-    url = f"{api_base}/tx/{txid}"
     try:
-        with urllib.request.urlopen(url, timeout=10) as response:
-            tx_data = json.loads(response.read().decode())
-            if vout < len(tx_data.get('vout', [])):
-                return tx_data['vout'][vout]
+        tx_data = _fetch_tx_json(txid, api_base)
+        if vout < len(tx_data.get('vout', [])):
+            return tx_data['vout'][vout]
     except Exception as e:
         print(f"Error fetching prev output: {e}", file=sys.stderr)
     return None
 
 
-def parse_transaction(tx_data: dict, tx_hex: str = None) -> Transaction:
+def _fetch_prev_tx(txid: str, api_base: str) -> Optional[dict]:
+    """Fetch a funding transaction, reporting failures as prev-output errors."""
+    try:
+        return _fetch_tx_json(txid, api_base)
+    except Exception as e:
+        print(f"Error fetching prev output: {e}", file=sys.stderr)
+        return None
+
+
+def fetch_prev_outputs_batched(inputs: List[TxInput], api_base: str = SIGNET_API,
+                               max_workers: int = 8) -> List[Optional[dict]]:
+    """
+    Fetch the previous outputs spent by all inputs concurrently.
+
+    Each distinct funding transaction is requested once, so inputs spending
+    several vouts of the same prior tx share a single round trip. Results
+    are returned in input order; entries are None where the fetch failed.
+    """
+    unique_txids = list(dict.fromkeys(inp.txid.hex() for inp in inputs))
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        tx_by_id = dict(zip(unique_txids,
+                            pool.map(lambda txid: _fetch_prev_tx(txid, api_base),
+                                     unique_txids)))
+
+    prev_outputs = []
+    for inp in inputs:
+        tx_data = tx_by_id[inp.txid.hex()]
+        vouts = tx_data.get('vout', []) if tx_data else []
+        prev_outputs.append(vouts[inp.vout] if inp.vout < len(vouts) else None)
+    return prev_outputs
+
+
+def parse_transaction(tx_data: dict, tx_hex: Optional[str] = None) -> Transaction:
     """Parse transaction from API response."""
+    # binascii.unhexlify is the strict C decoder: the API always returns
+    # plain lowercase hex, so bytes.fromhex's whitespace handling is unneeded.
+    unhex = binascii.unhexlify
+
     inputs = []
     for vin in tx_data.get('vin', []):
         witness = []
         if 'witness' in vin:
-            witness = [bytes.fromhex(w) for w in vin['witness']]
+            witness = list(map(unhex, vin['witness']))
 
         inputs.append(TxInput(
-            txid=bytes.fromhex(vin.get('txid', '0' * 64)),
+            txid_le=unhex(vin.get('txid', '0' * 64))[::-1],
             vout=vin.get('vout', 0),
-            script_sig=bytes.fromhex(vin.get('scriptsig', '')),
+            script_sig=unhex(vin.get('scriptsig', '')),
             sequence=vin.get('sequence', 0xffffffff),
             witness=witness
         ))
@@ -189,7 +417,7 @@ def parse_transaction(tx_data: dict, tx_hex: str = None) -> Transaction:
     for vout in tx_data.get('vout', []):
         outputs.append(TxOutput(
             value=vout.get('value', 0),
-            script_pubkey=bytes.fromhex(vout.get('scriptpubkey', ''))
+            script_pubkey=unhex(vout.get('scriptpubkey', ''))
         ))
 
     return Transaction(
@@ -201,6 +429,18 @@ def parse_transaction(tx_data: dict, tx_hex: str = None) -> Transaction:
     )
 
 
+# P2WPKH implied script code: OP_DUP OP_HASH160 <push 20> ... OP_EQUALVERIFY OP_CHECKSIG
+_P2WPKH_PREFIX = bytes([
+    0x76,  # OP_DUP
+    0xa9,  # OP_HASH160
+    0x14   # Push 20 bytes
+])
+_P2WPKH_SUFFIX = bytes([
+    0x88,  # OP_EQUALVERIFY
+    0xac   # OP_CHECKSIG
+])
+
+
 def extract_script_code(script_pubkey: bytes, witness: List[bytes]) -> bytes:
     """
     Extract the script code for sighash computation.
@@ -211,14 +451,7 @@ def extract_script_code(script_pubkey: bytes, witness: List[bytes]) -> bytes:
     if len(script_pubkey) == 22 and script_pubkey[0] == 0x00 and script_pubkey[1] == 0x14:
         # P2WPKH: version 0, 20-byte program
         pubkey_hash = script_pubkey[2:22]
-        return bytes([
-            0x76,  # OP_DUP
-            0xa9,  # OP_HASH160
-            0x14   # Push 20 bytes
-        ]) + pubkey_hash + bytes([
-            0x88,  # OP_EQUALVERIFY
-            0xac   # OP_CHECKSIG
-        ])
+        return b''.join((_P2WPKH_PREFIX, pubkey_hash, _P2WPKH_SUFFIX))
 
     elif len(script_pubkey) == 34 and script_pubkey[0] == 0x00 and script_pubkey[1] == 0x20:
         # P2WSH: version 0, 32-byte program (script hash)
@@ -374,6 +607,18 @@ def create_demo_transaction() -> dict:
     return demo_corrected
 
 
+def _dumps_indented(obj) -> bytes:
+    """
+    Serialize to 2-space indented JSON bytes, using orjson when available.
+
+    orjson produces bytes natively, so file output can be written without a
+    decode/encode round trip.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode()
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Fetch Bitcoin Signet transaction for Cato verification"
@@ -381,6 +626,8 @@ def main():
     parser.add_argument("txid", nargs="?", help="Transaction ID to fetch")
     parser.add_argument("--input", "-i", type=int, default=0,
                         help="Input index to verify (default: 0)")
+    parser.add_argument("--all-inputs", action="store_true",
+                        help="Verify every input, fetching previous outputs in parallel")
     parser.add_argument("--demo", action="store_true",
                         help="Generate demo transaction data")
     parser.add_argument("--output", "-o", help="Output file (default: stdout)")
@@ -391,14 +638,14 @@ def main():
 
     if args.demo:
         result = create_demo_transaction()
-        output = json.dumps(result, indent=2)
+        output = _dumps_indented(result)
 
         if args.output:
-            with open(args.output, 'w') as f:
+            with open(args.output, 'wb') as f:
                 f.write(output)
             print(f"Demo data written to {args.output}")
         else:
-            print(output)
+            print(output.decode())
         return
 
     if not args.txid:
@@ -415,33 +662,45 @@ def main():
     # Parse transaction
     tx = parse_transaction(tx_data)
 
-    if args.input >= len(tx.inputs):
-        print(f"Input index {args.input} out of range (tx has {len(tx.inputs)} inputs)",
-              file=sys.stderr)
-        sys.exit(1)
+    if args.all_inputs:
+        # Fetch all previous outputs at once, then generate one entry per input
+        prev_outs = fetch_prev_outputs_batched(tx.inputs, args.api)
+        result = []
+        for index, prev_out in enumerate(prev_outs):
+            if not prev_out:
+                print(f"Failed to fetch previous output for input {index}", file=sys.stderr)
+                sys.exit(1)
+            prev_value = prev_out.get('value', 0)
+            prev_script = bytes.fromhex(prev_out.get('scriptpubkey', ''))
+            result.append(generate_cato_test_data(tx, index, prev_value, prev_script))
+    else:
+        if args.input >= len(tx.inputs):
+            print(f"Input index {args.input} out of range (tx has {len(tx.inputs)} inputs)",
+                  file=sys.stderr)
+            sys.exit(1)
 
-    # Fetch previous output to get value and script
-    inp = tx.inputs[args.input]
-    prev_out = fetch_prev_output(inp.txid.hex(), inp.vout, args.api)
+        # Fetch previous output to get value and script
+        inp = tx.inputs[args.input]
+        prev_out = fetch_prev_output(inp.txid.hex(), inp.vout, args.api)
 
-    if not prev_out:
-        print("Failed to fetch previous output", file=sys.stderr)
-        sys.exit(1)
+        if not prev_out:
+            print("Failed to fetch previous output", file=sys.stderr)
+            sys.exit(1)
 
-    prev_value = prev_out.get('value', 0)
-    prev_script = bytes.fromhex(prev_out.get('scriptpubkey', ''))
+        prev_value = prev_out.get('value', 0)
+        prev_script = bytes.fromhex(prev_out.get('scriptpubkey', ''))
 
-    # Generate test data
-    result = generate_cato_test_data(tx, args.input, prev_value, prev_script)
+        # Generate test data
+        result = generate_cato_test_data(tx, args.input, prev_value, prev_script)
 
-    output = json.dumps(result, indent=2)
+    output = _dumps_indented(result)
 
     if args.output:
-        with open(args.output, 'w') as f:
+        with open(args.output, 'wb') as f:
             f.write(output)
         print(f"Data written to {args.output}", file=sys.stderr)
     else:
-        print(output)
+        print(output.decode())
 
 
 if __name__ == "__main__":
@@ -15,10 +15,19 @@ Reference: https://en.bitcoin.it/wiki/Script
 """
 
 import json
+import multiprocessing
 import struct
 from dataclasses import dataclass
-from typing import List, Optional, Tuple, Union
+from typing import Callable, List, Optional, Tuple, Union
 from enum import IntEnum
+from types import ModuleType
+
+orjson: Optional[ModuleType]
+try:
+    import orjson as _orjson
+    orjson = _orjson
+except ImportError:  # optional; falls back to stdlib json with identical output
+    orjson = None
 
 # Bitcoin Script constants
 MAX_SCRIPT_ELEMENT_SIZE = 520
@@ -42,6 +51,13 @@ class OP(IntEnum):
     OP_EQUAL = 0x87
     OP_ADD = 0x93
 
+# Plain-int aliases for the interpreter: comparing against a bare int skips
+# the OP attribute lookup and IntEnum member machinery in hot code
+_OP_0, _OP_VERIFY, _OP_DROP, _OP_DUP, _OP_CAT, _OP_EQUAL, _OP_ADD = (
+    int(OP.OP_0), int(OP.OP_VERIFY), int(OP.OP_DROP), int(OP.OP_DUP),
+    int(OP.OP_CAT), int(OP.OP_EQUAL), int(OP.OP_ADD),
+)
+
 class ScriptError(Exception):
     """Bitcoin Script execution error"""
     pass
@@ -58,19 +74,14 @@ def decode_script_num(data: bytes) -> int:
     if len(data) == 0:
         return 0
 
-    # Check if negative (MSB of last byte)
-    negative = (data[-1] & 0x80) != 0
-
-    # Build the absolute value
-    result = 0
-    for i, byte in enumerate(data):
-        if i == len(data) - 1 and negative:
-            # Remove sign bit from last byte
-            result |= (byte & 0x7f) << (8 * i)
-        else:
-            result |= byte << (8 * i)
+    result = int.from_bytes(data, 'little')
 
-    return -result if negative else result
+    # Check if negative (MSB of last byte)
+    sign_bit = 0x80 << (8 * (len(data) - 1))
+    if result & sign_bit:
+        # Remove sign bit from last byte
+        return -(result ^ sign_bit)
+    return result
 
 def encode_script_num(value: int) -> bytes:
     """
@@ -81,21 +92,16 @@ def encode_script_num(value: int) -> bytes:
 
     negative = value < 0
     absvalue = abs(value)
-
-    result = []
-    while absvalue > 0:
-        result.append(absvalue & 0xff)
-        absvalue >>= 8
+    length = (absvalue.bit_length() + 7) // 8
 
     # Add sign bit
-    if result[-1] & 0x80:
-        # Need an extra byte for sign
-        result.append(0x80 if negative else 0x00)
-    elif negative:
+    if absvalue >> (8 * length - 1):
+        # Top bit of the last byte is taken: need an extra byte for sign
+        return absvalue.to_bytes(length, 'little') + (b'\x80' if negative else b'\x00')
+    if negative:
         # Set sign bit in existing last byte
-        result[-1] |= 0x80
-
-    return bytes(result)
+        absvalue |= 0x80 << (8 * (length - 1))
+    return absvalue.to_bytes(length, 'little')
 
 def is_truthy(data: bytes) -> bool:
     """
@@ -108,125 +114,210 @@ def is_truthy(data: bytes) -> bool:
     if len(data) == 0:
         return False
 
-    # Check for all zeros (with possible negative zero)
-    for i, byte in enumerate(data):
-        if i == len(data) - 1:
-            # Last byte: check ignoring sign bit
-            if byte & 0x7f != 0:
-                return True
-        else:
-            if byte != 0:
-                return True
+    # Last byte: check ignoring sign bit
+    if data[-1] & 0x7f:
+        return True
 
-    return False
+    # Any other non-zero byte (scanned in C)
+    return any(data[:-1])
+
+# ============================================
+# Opcode handlers
+# ============================================
+#
+# Each handler takes (vm, script, pc) with pc pointing just past the opcode
+# byte, performs the operation on vm.stack[:vm.sp], and returns the pc of
+# the next opcode. Failures raise ScriptError.
+
+_Handler = Callable[['BitcoinScriptVM', bytes, int], int]
+
+def _make_push(n: int) -> _Handler:
+    """Handler for opcodes 0x01-0x4b, which push the next n script bytes."""
+    def _op_push_n(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+        # A short slice means the script ran out, so the slice doubles as
+        # the bounds check.
+        data = script[pc:pc+n]
+        if len(data) != n:
+            raise ScriptError("PUSH: not enough data")
+        sp = vm.sp
+        if sp >= MAX_STACK_SIZE:
+            raise ScriptError("Stack overflow")
+        vm.stack[sp] = data
+        vm.sp = sp + 1
+        return pc + n
+    return _op_push_n
+
+def _op_push(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+    # OP_0 / OP_FALSE (in Cato we use this as OP_PUSH with length byte)
+    # In our Cato format: OP_PUSH length data
+    n = len(script)
+    if pc >= n:
+        raise ScriptError("OP_PUSH: missing length")
+    length = script[pc]
+    pc += 1
+    if pc + length > n:
+        raise ScriptError("OP_PUSH: not enough data")
+    # Plain bytes slices on purpose: for elements this small, slicing a
+    # memoryview costs more than copying, and views would have to be
+    # materialized again before output.
+    data = script[pc:pc+length]
+    if len(data) > MAX_SCRIPT_ELEMENT_SIZE:
+        raise ScriptError("OP_PUSH: element too large")
+    sp = vm.sp
+    if sp >= MAX_STACK_SIZE:
+        raise ScriptError("Stack overflow")
+    vm.stack[sp] = data
+    vm.sp = sp + 1
+    return pc + length
+
+def _op_verify(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+    sp = vm.sp - 1
+    if sp < 0:
+        raise ScriptError("OP_VERIFY: stack underflow")
+    vm.sp = sp
+    top = vm.stack[sp]
+    if not is_truthy(top):
+        raise ScriptError("OP_VERIFY: failed")
+    return pc
+
+def _op_drop(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+    if vm.sp < 1:
+        raise ScriptError("OP_DROP: stack underflow")
+    vm.sp -= 1
+    return pc
+
+def _op_dup(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+    sp = vm.sp
+    if sp < 1:
+        raise ScriptError("OP_DUP: stack underflow")
+    if sp >= MAX_STACK_SIZE:
+        raise ScriptError("Stack overflow")
+    stack = vm.stack
+    stack[sp] = stack[sp - 1]
+    vm.sp = sp + 1
+    return pc
+
+def _op_cat(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+    # OP_CAT: Pop b, pop a, push a||b
+    # A run of k consecutive OP_CATs folds the top k+1 elements together in
+    # stack order, so do it with one join instead of k intermediate
+    # concatenations. join sizes the output once and copies each operand
+    # exactly once, which is as cheap as extending a uniquely-owned
+    # bytearray in place would be, without making every push copy its data
+    # into a mutable buffer (and OP_DUP copy to preserve aliasing).
+    n = len(script)
+    run = 1
+    while pc < n and script[pc] == _OP_CAT:
+        run += 1
+        pc += 1
+    sp = vm.sp
+    if sp < 2:
+        raise ScriptError("OP_CAT: stack underflow")
+    stack = vm.stack
+    # Only an oversized initial stack can leave the first CAT's push past
+    # MAX_STACK_SIZE (later ones sit lower), and its result-size check
+    # comes first.
+    if sp - 2 >= MAX_STACK_SIZE:
+        if len(stack[sp - 2]) + len(stack[sp - 1]) > MAX_SCRIPT_ELEMENT_SIZE:
+            raise ScriptError("OP_CAT: result too large")
+        raise ScriptError("Stack overflow")
+    # Fuse only as many CATs as the stack can feed; intermediate results only
+    # grow, so the size check on the fused result fails iff one of the
+    # sequential CATs would have.
+    fused = min(run, sp - 1)
+    sp -= fused + 1
+    result = b''.join(stack[sp:sp + fused + 1])
+    if len(result) > MAX_SCRIPT_ELEMENT_SIZE:
+        raise ScriptError("OP_CAT: result too large")
+    stack[sp] = result
+    vm.sp = sp + 1
+    if fused < run:
+        raise ScriptError("OP_CAT: stack underflow")
+    return pc
+
+def _op_equal(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+    sp = vm.sp - 1
+    if sp < 1:
+        raise ScriptError("OP_EQUAL: stack underflow")
+    vm.sp = sp
+    stack = vm.stack
+    b = stack[sp]
+    a = stack[sp - 1]
+    stack[sp - 1] = encode_script_num(1 if a == b else 0)
+    return pc
+
+def _op_add(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+    sp = vm.sp - 1
+    if sp < 1:
+        raise ScriptError("OP_ADD: stack underflow")
+    vm.sp = sp
+    stack = vm.stack
+    b = decode_script_num(stack[sp])
+    a = decode_script_num(stack[sp - 1])
+    result = encode_script_num(a + b)
+    # A sum is at most one byte longer than its longer operand, so this can
+    # only fire when an operand is already MAX_SCRIPT_ELEMENT_SIZE bytes
+    # (e.g. OP_CAT output fed into OP_ADD). It is a single compare, cheaper
+    # than any operand-size guard that would try to skip it.
+    if len(result) > MAX_SCRIPT_ELEMENT_SIZE:
+        raise ScriptError("OP_ADD: result too large")
+    stack[sp - 1] = result
+    return pc
+
+def _op_unknown(vm: 'BitcoinScriptVM', script: bytes, pc: int) -> int:
+    raise ScriptError(f"Unknown opcode: 0x{script[pc - 1]:02x}")
+
+def _build_handlers() -> Tuple[_Handler, ...]:
+    """256-entry dispatch table indexed by opcode byte."""
+    handlers: List[_Handler] = [_op_unknown] * 256
+    # Handle push operations (opcodes 0x01-0x4b push that many bytes)
+    for n in range(0x01, 0x4c):
+        handlers[n] = _make_push(n)
+    handlers[_OP_0] = _op_push
+    handlers[_OP_VERIFY] = _op_verify
+    handlers[_OP_DROP] = _op_drop
+    handlers[_OP_DUP] = _op_dup
+    handlers[_OP_CAT] = _op_cat
+    handlers[_OP_EQUAL] = _op_equal
+    handlers[_OP_ADD] = _op_add
+    return tuple(handlers)
+
+HANDLERS: Tuple[_Handler, ...] = _build_handlers()
 
 class BitcoinScriptVM:
     """
     Minimal Bitcoin Script interpreter with OP_CAT enabled.
     """
 
-    def __init__(self):
-        self.stack: List[bytes] = []
+    def __init__(self) -> None:
+        # Fixed-size stack buffer; only stack[:sp] is live
+        self.stack: List[bytes] = [b''] * MAX_STACK_SIZE
+        self.sp: int = 0
         self.error: Optional[str] = None
 
-    def execute(self, script: bytes, initial_stack: List[bytes] = None) -> bool:
+    def execute(self, script: bytes, initial_stack: Optional[List[bytes]] = None) -> bool:
         """Execute a script and return True if successful."""
-        self.stack = list(initial_stack) if initial_stack else []
+        # Reuse the preallocated buffer across runs: copy the initial stack
+        # into its bottom slots rather than building a new list each call.
+        # Slots at and above sp are dead and simply get overwritten.
+        self.sp = 0
+        if initial_stack:
+            n = len(initial_stack)
+            if n > len(self.stack):
+                self.stack.extend([b''] * (n - len(self.stack)))
+            self.stack[:n] = initial_stack
+            self.sp = n
         self.error = None
 
+        handlers = HANDLERS
+        n = len(script)
         pc = 0
-        while pc < len(script):
-            opcode = script[pc]
-            pc += 1
-
-            try:
-                # Handle push operations (opcodes 0x01-0x4b push that many bytes)
-                if 0x01 <= opcode <= 0x4b:
-                    if pc + opcode > len(script):
-                        raise ScriptError("PUSH: not enough data")
-                    self.stack.append(script[pc:pc+opcode])
-                    pc += opcode
-                    continue
-
-                # OP_0 / OP_FALSE (in Cato we use this as OP_PUSH with length byte)
-                if opcode == OP.OP_0:
-                    # In our Cato format: OP_PUSH length data
-                    if pc >= len(script):
-                        raise ScriptError("OP_PUSH: missing length")
-                    length = script[pc]
-                    pc += 1
-                    if pc + length > len(script):
-                        raise ScriptError("OP_PUSH: not enough data")
-                    data = script[pc:pc+length]
-                    if len(data) > MAX_SCRIPT_ELEMENT_SIZE:
-                        raise ScriptError("OP_PUSH: element too large")
-                    if len(self.stack) >= MAX_STACK_SIZE:
-                        raise ScriptError("Stack overflow")
-                    self.stack.append(data)
-                    pc += length
-                    continue
-
-                if opcode == OP.OP_VERIFY:
-                    if len(self.stack) < 1:
-                        raise ScriptError("OP_VERIFY: stack underflow")
-                    top = self.stack.pop()
-                    if not is_truthy(top):
-                        raise ScriptError("OP_VERIFY: failed")
-                    continue
-
-                if opcode == OP.OP_DROP:
-                    if len(self.stack) < 1:
-                        raise ScriptError("OP_DROP: stack underflow")
-                    self.stack.pop()
-                    continue
-
-                if opcode == OP.OP_DUP:
-                    if len(self.stack) < 1:
-                        raise ScriptError("OP_DUP: stack underflow")
-                    if len(self.stack) >= MAX_STACK_SIZE:
-                        raise ScriptError("Stack overflow")
-                    self.stack.append(self.stack[-1])
-                    continue
-
-                if opcode == OP.OP_CAT:
-                    # OP_CAT: Pop b, pop a, push a||b
-                    if len(self.stack) < 2:
-                        raise ScriptError("OP_CAT: stack underflow")
-                    b = self.stack.pop()
-                    a = self.stack.pop()
-                    result = a + b  # Concatenate a first, then b
-                    if len(result) > MAX_SCRIPT_ELEMENT_SIZE:
-                        raise ScriptError("OP_CAT: result too large")
-                    if len(self.stack) >= MAX_STACK_SIZE:
-                        raise ScriptError("Stack overflow")
-                    self.stack.append(result)
-                    continue
-
-                if opcode == OP.OP_EQUAL:
-                    if len(self.stack) < 2:
-                        raise ScriptError("OP_EQUAL: stack underflow")
-                    b = self.stack.pop()
-                    a = self.stack.pop()
-                    result = encode_script_num(1 if a == b else 0)
-                    self.stack.append(result)
-                    continue
-
-                if opcode == OP.OP_ADD:
-                    if len(self.stack) < 2:
-                        raise ScriptError("OP_ADD: stack underflow")
-                    b = decode_script_num(self.stack.pop())
-                    a = decode_script_num(self.stack.pop())
-                    result = encode_script_num(a + b)
-                    if len(result) > MAX_SCRIPT_ELEMENT_SIZE:
-                        raise ScriptError("OP_ADD: result too large")
-                    self.stack.append(result)
-                    continue
-
-                raise ScriptError(f"Unknown opcode: 0x{opcode:02x}")
-
-            except ScriptError as e:
-                self.error = str(e)
-                return False
+        try:
+            while pc < n:
+                pc = handlers[script[pc]](self, script, pc + 1)
+        except ScriptError as e:
+            self.error = str(e)
+            return False
 
         return True
 
@@ -237,244 +328,128 @@ def generate_test_vector(name: str, description: str,
 
     success = vm.execute(script, initial_stack)
 
-    vector = {
+    vector: dict = {
         "name": name,
         "description": description,
-        "initial_stack": [s.hex() for s in initial_stack],
+        "initial_stack": list(map(bytes.hex, initial_stack)),
         "script": script.hex(),
     }
 
     if success:
-        vector["expected_final_stack"] = [s.hex() for s in vm.stack]
+        vector["expected_final_stack"] = list(map(bytes.hex, vm.stack[:vm.sp]))
     else:
         vector["expected_error"] = vm.error
 
     return vector
 
-def main():
-    vm = BitcoinScriptVM()
-    vectors = []
-
+# Static push data for the size-boundary vectors, sliced out of a repeating
+# 0x00..0xff cycle once at import instead of rebuilt byte-by-byte in main().
+_BYTE_CYCLE = bytes(range(256)) * 2
+ALL_BYTES_A = _BYTE_CYCLE[:128]        # 0x00..0x7f
+ALL_BYTES_B = _BYTE_CYCLE[128:256]     # 0x80..0xff
+MAX_A = _BYTE_CYCLE[:260]              # i % 256 for i in range(260)
+MAX_B = _BYTE_CYCLE[128:128 + 260]     # (i + 128) % 256 for i in range(260)
+OVER_A = OVER_B = _BYTE_CYCLE[:261]    # i % 256 for i in range(261)
+
+# Scripts shared by many vectors, built once
+_CAT = bytes([OP.OP_CAT])
+_DUP_CAT = bytes([OP.OP_DUP, OP.OP_CAT])
+_CHAIN3 = bytes([OP.OP_CAT, OP.OP_CAT, OP.OP_CAT])
+_ADD = bytes([OP.OP_ADD])
+_CAT_VERIFY = bytes([OP.OP_CAT, OP.OP_VERIFY])
+_PUSH_CAT = bytes([
+    OP.OP_0, 2, ord('A'), ord('B'),  # PUSH "AB"
+    OP.OP_0, 2, ord('C'), ord('D'),  # PUSH "CD"
+    OP.OP_CAT
+])
+
+# Test vector specs: (name, description, initial_stack, script)
+SPECS: List[Tuple[str, str, List[bytes], bytes]] = [
     # ============================================
     # OP_CAT Test Vectors
     # ============================================
 
     # Basic concatenation
-    vectors.append(generate_test_vector(
-        "cat_hello_world",
-        "Concatenate 'hello' and 'world'",
-        [b"hello", b"world"],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_hello_world", "Concatenate 'hello' and 'world'", [b"hello", b"world"], _CAT),
 
     # Empty strings
-    vectors.append(generate_test_vector(
-        "cat_empty_left",
-        "Empty string + 'abc'",
-        [b"", b"abc"],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
-
-    vectors.append(generate_test_vector(
-        "cat_empty_right",
-        "'abc' + empty string",
-        [b"abc", b""],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
-
-    vectors.append(generate_test_vector(
-        "cat_both_empty",
-        "Two empty strings",
-        [b"", b""],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_empty_left", "Empty string + 'abc'", [b"", b"abc"], _CAT),
+    ("cat_empty_right", "'abc' + empty string", [b"abc", b""], _CAT),
+    ("cat_both_empty", "Two empty strings", [b"", b""], _CAT),
 
     # Binary data with null bytes
-    vectors.append(generate_test_vector(
-        "cat_binary_with_nulls",
-        "Binary data with null bytes",
-        [bytes([0x00, 0xff, 0x00]), bytes([0xff, 0x00, 0xff])],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_binary_with_nulls", "Binary data with null bytes",
+     [bytes([0x00, 0xff, 0x00]), bytes([0xff, 0x00, 0xff])], _CAT),
 
     # Single bytes
-    vectors.append(generate_test_vector(
-        "cat_single_bytes",
-        "Concatenate single bytes",
-        [bytes([0x01]), bytes([0x02])],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_single_bytes", "Concatenate single bytes", [bytes([0x01]), bytes([0x02])], _CAT),
 
     # All byte values (verify no transformation)
-    all_bytes_a = bytes(range(0, 128))
-    all_bytes_b = bytes(range(128, 256))
-    vectors.append(generate_test_vector(
-        "cat_all_byte_values",
-        "All 256 byte values preserved",
-        [all_bytes_a, all_bytes_b],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_all_byte_values", "All 256 byte values preserved", [ALL_BYTES_A, ALL_BYTES_B], _CAT),
 
     # Maximum size (260 + 260 = 520)
-    max_a = bytes([i % 256 for i in range(260)])
-    max_b = bytes([(i + 128) % 256 for i in range(260)])
-    vectors.append(generate_test_vector(
-        "cat_max_size_520",
-        "Maximum valid size 260+260=520",
-        [max_a, max_b],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_max_size_520", "Maximum valid size 260+260=520", [MAX_A, MAX_B], _CAT),
 
     # Exceeds max size (261 + 261 = 522)
-    over_a = bytes([i % 256 for i in range(261)])
-    over_b = bytes([i % 256 for i in range(261)])
-    vectors.append(generate_test_vector(
-        "cat_exceeds_max_size",
-        "Exceeds max: 261+261=522",
-        [over_a, over_b],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_exceeds_max_size", "Exceeds max: 261+261=522", [OVER_A, OVER_B], _CAT),
 
     # Stack underflow - empty stack
-    vectors.append(generate_test_vector(
-        "cat_underflow_empty",
-        "OP_CAT with empty stack",
-        [],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_underflow_empty", "OP_CAT with empty stack", [], _CAT),
 
     # Stack underflow - one element
-    vectors.append(generate_test_vector(
-        "cat_underflow_one",
-        "OP_CAT with only one element",
-        [bytes([0xde, 0xad, 0xbe, 0xef])],
-        bytes([OP.OP_CAT]),
-        vm
-    ))
+    ("cat_underflow_one", "OP_CAT with only one element",
+     [bytes([0xde, 0xad, 0xbe, 0xef])], _CAT),
 
     # Chained CAT operations
-    vectors.append(generate_test_vector(
-        "cat_chain_4_elements",
-        "Chain: [a,b,c,d] with 3 CATs",
-        [b"a", b"b", b"c", b"d"],
-        bytes([OP.OP_CAT, OP.OP_CAT, OP.OP_CAT]),
-        vm
-    ))
+    ("cat_chain_4_elements", "Chain: [a,b,c,d] with 3 CATs", [b"a", b"b", b"c", b"d"], _CHAIN3),
 
     # DUP then CAT
-    vectors.append(generate_test_vector(
-        "cat_with_dup",
-        "DUP then CAT doubles string",
-        [b"ABC"],
-        bytes([OP.OP_DUP, OP.OP_CAT]),
-        vm
-    ))
+    ("cat_with_dup", "DUP then CAT doubles string", [b"ABC"], _DUP_CAT),
 
     # ============================================
     # OP_ADD Test Vectors
     # ============================================
 
-    vectors.append(generate_test_vector(
-        "add_2_plus_3",
-        "2 + 3 = 5",
-        [encode_script_num(2), encode_script_num(3)],
-        bytes([OP.OP_ADD]),
-        vm
-    ))
-
-    vectors.append(generate_test_vector(
-        "add_zero_left",
-        "0 + 42 = 42",
-        [encode_script_num(0), encode_script_num(42)],
-        bytes([OP.OP_ADD]),
-        vm
-    ))
-
-    vectors.append(generate_test_vector(
-        "add_negative",
-        "-5 + 10 = 5",
-        [encode_script_num(-5), encode_script_num(10)],
-        bytes([OP.OP_ADD]),
-        vm
-    ))
-
-    vectors.append(generate_test_vector(
-        "add_two_negatives",
-        "-3 + -7 = -10",
-        [encode_script_num(-3), encode_script_num(-7)],
-        bytes([OP.OP_ADD]),
-        vm
-    ))
-
-    vectors.append(generate_test_vector(
-        "add_cancel_to_zero",
-        "5 + -5 = 0",
-        [encode_script_num(5), encode_script_num(-5)],
-        bytes([OP.OP_ADD]),
-        vm
-    ))
-
-    vectors.append(generate_test_vector(
-        "add_127_plus_1",
-        "127 + 1 = 128 (needs 2 bytes)",
-        [encode_script_num(127), encode_script_num(1)],
-        bytes([OP.OP_ADD]),
-        vm
-    ))
-
-    vectors.append(generate_test_vector(
-        "add_256_plus_256",
-        "256 + 256 = 512",
-        [encode_script_num(256), encode_script_num(256)],
-        bytes([OP.OP_ADD]),
-        vm
-    ))
+    ("add_2_plus_3", "2 + 3 = 5", [encode_script_num(2), encode_script_num(3)], _ADD),
+    ("add_zero_left", "0 + 42 = 42", [encode_script_num(0), encode_script_num(42)], _ADD),
+    ("add_negative", "-5 + 10 = 5", [encode_script_num(-5), encode_script_num(10)], _ADD),
+    ("add_two_negatives", "-3 + -7 = -10", [encode_script_num(-3), encode_script_num(-7)], _ADD),
+    ("add_cancel_to_zero", "5 + -5 = 0", [encode_script_num(5), encode_script_num(-5)], _ADD),
+    ("add_127_plus_1", "127 + 1 = 128 (needs 2 bytes)",
+     [encode_script_num(127), encode_script_num(1)], _ADD),
+    ("add_256_plus_256", "256 + 256 = 512",
+     [encode_script_num(256), encode_script_num(256)], _ADD),
 
     # ============================================
     # Combined Script Vectors
     # ============================================
 
     # PUSH + CAT
-    script_push_cat = bytes([
-        OP.OP_0, 2, ord('A'), ord('B'),  # PUSH "AB"
-        OP.OP_0, 2, ord('C'), ord('D'),  # PUSH "CD"
-        OP.OP_CAT
-    ])
-    vectors.append(generate_test_vector(
-        "script_push_cat",
-        "PUSH 'AB' PUSH 'CD' CAT",
-        [],
-        script_push_cat,
-        vm
-    ))
+    ("script_push_cat", "PUSH 'AB' PUSH 'CD' CAT", [], _PUSH_CAT),
 
     # CAT + VERIFY (truthy result)
-    vectors.append(generate_test_vector(
-        "cat_verify_truthy",
-        "CAT produces truthy, VERIFY passes",
-        [bytes([0x01]), bytes([0x02])],
-        bytes([OP.OP_CAT, OP.OP_VERIFY]),
-        vm
-    ))
+    ("cat_verify_truthy", "CAT produces truthy, VERIFY passes",
+     [bytes([0x01]), bytes([0x02])], _CAT_VERIFY),
 
     # CAT + VERIFY (falsy result - both empty)
-    vectors.append(generate_test_vector(
-        "cat_verify_falsy",
-        "CAT of empties is falsy, VERIFY fails",
-        [b"", b""],
-        bytes([OP.OP_CAT, OP.OP_VERIFY]),
-        vm
-    ))
+    ("cat_verify_falsy", "CAT of empties is falsy, VERIFY fails", [b"", b""], _CAT_VERIFY),
+]
+
+# Below this many specs, forking workers costs more than running serially.
+_POOL_MIN_SPECS = 32
+
+def _run_spec(spec: Tuple[str, str, List[bytes], bytes]) -> dict:
+    """Pool worker: run one spec on a fresh VM."""
+    return generate_test_vector(*spec, BitcoinScriptVM())
+
+def main() -> None:
+    if len(SPECS) < _POOL_MIN_SPECS:
+        vm = BitcoinScriptVM()
+        vectors = [generate_test_vector(*spec, vm) for spec in SPECS]
+    else:
+        # imap (not imap_unordered) keeps the vectors in SPECS order.
+        with multiprocessing.Pool() as pool:
+            vectors = list(pool.imap(_run_spec, SPECS, chunksize=8))
 
     # Save vectors
     output = {
@@ -497,8 +472,12 @@ def main():
     }
 
     output_path = "test_vectors/bitcoin_ground_truth.json"
-    with open(output_path, 'w') as f:
-        json.dump(output, f, indent=2)
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(output, option=orjson.OPT_INDENT_2))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(output, f, indent=2)
 
     print(f"Generated {len(vectors)} test vectors to {output_path}")
 